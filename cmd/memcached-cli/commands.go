@@ -1,7 +1,10 @@
 package main
 
 import (
+	"bufio"
 	"fmt"
+	"io"
+	"os"
 	"strings"
 	"time"
 
@@ -407,24 +410,36 @@ func newKVFlushAllCommand() *cobra.Command {
 }
 
 func printMetaItems(items []*memcached.MetaItem) {
+	// Buffer the whole listing and write it to stdout once, rather than
+	// issuing a write per line per item.
+	w := bufio.NewWriter(os.Stdout)
+	defer w.Flush()
+
 	for idx, item := range items {
-		fmt.Printf(" ================= The [%d] item =================\n", idx)
-		printMetaItem(item)
+		fmt.Fprintf(w, " ================= The [%d] item =================\n", idx)
+		writeMetaItem(w, item)
 	}
 }
 
 func printMetaItem(item *memcached.MetaItem) {
+	w := bufio.NewWriter(os.Stdout)
+	defer w.Flush()
+
+	writeMetaItem(w, item)
+}
+
+func writeMetaItem(w io.Writer, item *memcached.MetaItem) {
 	lastAccessAt := time.Now().Add(-time.Duration(item.LastAccessedTime) * time.Second)
 
-	fmt.Printf("Key:              %s\n", item.Key)
-	fmt.Printf("Flags:            %d (0x%x)\n", item.Flags, item.Flags)
-	fmt.Printf("CAS:              %d (0x%x)\n", item.CAS, item.CAS)
-	fmt.Printf("ClientFlags:      %d (0x%x)\n", item.Flags, item.Flags)
-	fmt.Printf("LastAccessedTime: %s (%s)\n", lastAccessAt.Format(time.RFC3339), formatSeconds(int(item.LastAccessedTime), "before", "never"))
-	fmt.Printf("HitBefore:        %s\n", map[bool]string{true: "✅", false: "❌"}[item.HitBefore])
-	fmt.Printf("TTL:              %d (%s)\n", item.TTL, formatSeconds(int(item.TTL), "later", "never expires"))
-	fmt.Printf("Value:            %s\n", item.Value)
-	fmt.Println()
+	fmt.Fprintf(w, "Key:              %s\n", item.Key)
+	fmt.Fprintf(w, "Flags:            %d (0x%x)\n", item.Flags, item.Flags)
+	fmt.Fprintf(w, "CAS:              %d (0x%x)\n", item.CAS, item.CAS)
+	fmt.Fprintf(w, "ClientFlags:      %d (0x%x)\n", item.Flags, item.Flags)
+	fmt.Fprintf(w, "LastAccessedTime: %s (%s)\n", lastAccessAt.Format(time.RFC3339), formatSeconds(int(item.LastAccessedTime), "before", "never"))
+	fmt.Fprintf(w, "HitBefore:        %s\n", map[bool]string{true: "✅", false: "❌"}[item.HitBefore])
+	fmt.Fprintf(w, "TTL:              %d (%s)\n", item.TTL, formatSeconds(int(item.TTL), "later", "never expires"))
+	fmt.Fprintf(w, "Value:            %s\n", item.Value)
+	fmt.Fprintln(w)
 }
 
 func formatSeconds(seconds int, suffix, zeroString string) (readable string) {
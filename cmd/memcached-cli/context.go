@@ -55,15 +55,7 @@ func createClient(ctx *Context) (memcached.Client, error) {
 		builder = memcached.NewMurmur3HashPickBuilder(magicSeed)
 	}
 
-	_uniqueServers := make([]string, 0, 4)
-	for _, server := range strings.Split(ctx.Servers, ",") {
-		if lo.Contains(_uniqueServers, strings.TrimSpace(server)) {
-			continue
-		}
-
-		_uniqueServers = append(_uniqueServers, strings.TrimSpace(server))
-	}
-	uniqServers := strings.Join(_uniqueServers, ",")
+	uniqServers := uniqueServers(ctx.Servers)
 
 	client, err := memcached.New(
 		uniqServers,
@@ -79,3 +71,21 @@ func createClient(ctx *Context) (memcached.Client, error) {
 
 	return client, nil
 }
+
+// uniqueServers trims each entry of the comma-separated servers list, and
+// drops duplicates while keeping the original order.
+func uniqueServers(servers string) string {
+	seen := make(map[string]struct{}, 4)
+	unique := make([]string, 0, 4)
+	for _, server := range strings.Split(servers, ",") {
+		server = strings.TrimSpace(server)
+		if _, ok := seen[server]; ok {
+			continue
+		}
+
+		seen[server] = struct{}{}
+		unique = append(unique, server)
+	}
+
+	return strings.Join(unique, ",")
+}
@@ -1,7 +1,9 @@
 package main
 
 import (
+	"bytes"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -19,6 +21,9 @@ type contextManager struct {
 	path            string
 	historyMaxLines int
 	historyEnabled  bool
+	// saved is the config file content as last read or written, used to
+	// skip rewriting an unchanged config.
+	saved []byte
 
 	currentClient  memcached.Client
 	historyManager *kvCommandHistoryManager
@@ -55,17 +60,20 @@ func newContextManager() (*contextManager, error) {
 }
 
 func (m *contextManager) close() error {
-	m.save()
+	// Close the client even when saving fails, and report both errors.
+	saveErr := m.save()
 
+	var closeErr error
 	if m.currentClient != nil {
-		return m.currentClient.Close()
+		closeErr = m.currentClient.Close()
 	}
 
-	return nil
+	return errors.Join(saveErr, closeErr)
 }
 
-// initialize loads CLI config file and initialize current client while
-// the current is not empty.
+// initialize loads CLI config file. The client of the current context is
+// created lazily by getCurrentClient on first use, so commands which never
+// talk to memcached don't pay for it.
 func (m *contextManager) initialize() error {
 	data, err := os.ReadFile(m.path)
 	if err != nil {
@@ -84,16 +92,13 @@ func (m *contextManager) initialize() error {
 	}
 
 	m.mu.Lock()
+	defer m.mu.Unlock()
+
+	m.saved = data
 	m.contexts = stored.Contexts
 	m.current = stored.Current
 	m.historyMaxLines = stored.HistoryMaxLines
 	m.historyEnabled = stored.HistoryEnabled
-	if m.current != "" {
-		m.currentClient, err = createClient(m.contexts[m.current])
-		if err != nil {
-			return err
-		}
-	}
 
 	if m.historyEnabled {
 		m.historyManager, err = newHistoryManager(m.historyEnabled, m.historyMaxLines)
@@ -102,15 +107,13 @@ func (m *contextManager) initialize() error {
 		}
 	}
 
-	m.mu.Unlock()
-
 	return nil
 }
 
 // save writes contexts to disk
 func (m *contextManager) save() error {
-	m.mu.RLock()
-	defer m.mu.RUnlock()
+	m.mu.Lock()
+	defer m.mu.Unlock()
 
 	if m.resetCurrent != nil {
 		m.current = m.resetCurrent()
@@ -127,14 +130,24 @@ func (m *contextManager) save() error {
 		HistoryEnabled:  m.historyEnabled,
 		Contexts:        m.contexts,
 	}, "", "  ")
+	if err != nil {
+		return err
+	}
+
+	// Most commands (kv get, ctx list, ...) don't change anything, don't
+	// rewrite the file for them.
+	if bytes.Equal(data, m.saved) {
+		return nil
+	}
 
 	logger.Debugf("saving context to %s, current=%s, contexts=%+v", m.path, m.current, m.contexts)
 
-	if err != nil {
+	if err := os.WriteFile(m.path, data, 0644); err != nil {
 		return err
 	}
 
-	return os.WriteFile(m.path, data, 0644)
+	m.saved = data
+	return nil
 }
 
 // addTemporaryContext creates a new temporary context for interactive use
@@ -37,14 +37,23 @@ export const COMMANDS: CommandDef[] = [
   { id: 'version', label: 'Version', group: 'admin', inputs: [], needsConfirmation: false },
 ]
 
-export const COMMAND_GROUPS = [
+export const COMMAND_GROUPS: { id: CommandDef['group']; label: string }[] = [
   { id: 'storage', label: 'Storage Operations' },
   { id: 'counter', label: 'Counter Operations' },
   { id: 'admin', label: 'Admin Operations' },
 ]
 
+// Commands bucketed by group once, so menus don't re-filter COMMANDS on every render.
+export const COMMANDS_BY_GROUP: Record<CommandDef['group'], CommandDef[]> = {
+  storage: COMMANDS.filter(c => c.group === 'storage'),
+  counter: COMMANDS.filter(c => c.group === 'counter'),
+  admin: COMMANDS.filter(c => c.group === 'admin'),
+}
+
+const COMMANDS_BY_ID = new Map<string, CommandDef>(COMMANDS.map(c => [c.id, c]))
+
 export function getCommand(id: string): CommandDef | undefined {
-  return COMMANDS.find(c => c.id === id)
+  return COMMANDS_BY_ID.get(id)
 }
 
 export type CommandId = 'get' | 'set' | 'delete' | 'incr' | 'decr' | 'stats' | 'flushall' | 'version'
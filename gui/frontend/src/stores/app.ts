@@ -1,4 +1,4 @@
-import { writable, derived } from 'svelte/store'
+import { writable, derived, get } from 'svelte/store'
 
 export interface McServer {
   host: string
@@ -12,6 +12,7 @@ export interface McContext {
 }
 
 export interface LogEntry {
+  id: number
   time: string
   op: string
   key?: string
@@ -69,8 +70,61 @@ export const activeOperationTab = writable<OperationTab>('get')
 export const themeMode = writable<ThemeMode>('system')
 
 // Helpers
-export function addLog(entry: Omit<LogEntry, 'time'>) {
+
+// Connection transitions. These are the only writers of the connection state
+// stores, so the banner, sidebar and operation panel always see one
+// consistent state.
+export function setConnected(id: string, name: string) {
+  connected.set(true)
+  activeContextId.set(id)
+  connectionStatus.set('connected')
+  connectionError.set('')
+  activeContextName.set(name)
+}
+
+export function setDisconnected() {
+  connected.set(false)
+  activeContextId.set(null)
+  connectionStatus.set('disconnected')
+  connectionError.set('')
+  activeContextName.set('')
+}
+
+export function setConnectionError(message: string) {
+  connected.set(false)
+  activeContextId.set(null)
+  connectionStatus.set('error')
+  connectionError.set(message)
+  activeContextName.set('')
+}
+
+// renameActiveContext keeps the displayed name in step with an edit of the
+// active context; other contexts leave the connection state alone.
+export function renameActiveContext(id: string, name: string) {
+  if (get(activeContextId) === id) {
+    activeContextName.set(name)
+  }
+}
+
+const MAX_LOGS = 200
+
+let nextLogId = 0
+let pendingLogs: LogEntry[] = []
+
+function flushLogs() {
+  const batch = pendingLogs.reverse()
+  pendingLogs = []
+  logs.update(v => [...batch, ...v].slice(0, MAX_LOGS))
+}
+
+// addLog queues the entry and publishes all entries queued within the same
+// frame in one store update, so the log list re-renders once per burst.
+export function addLog(entry: Omit<LogEntry, 'id' | 'time'>) {
   const now = new Date()
   const time = now.toLocaleTimeString()
-  logs.update(v => [{ ...entry, time }, ...v].slice(0, 200))
+  const id = nextLogId++
+  if (pendingLogs.length === 0) {
+    requestAnimationFrame(flushLogs)
+  }
+  pendingLogs.push({ ...entry, id, time })
 }
@@ -11,6 +11,8 @@ function createKeyHistoryStore() {
   function add(key: string) {
     if (!key.trim()) return
     update(list => {
+      // Repeat lookups of the most recent key change nothing, skip the rewrite.
+      if (list[0] === key) return list
       const filtered = list.filter(k => k !== key)
       const updated = [key, ...filtered].slice(0, MAX_HISTORY)
       saveJson(STORAGE_KEY, updated)
@@ -26,9 +28,15 @@ function createKeyHistoryStore() {
   function filterByPrefix(prefix: string, limit = 5): string[] {
     if (!prefix) return []
     const list = get({ subscribe })
-    return list
-      .filter(k => k.toLowerCase().includes(prefix.toLowerCase()))
-      .slice(0, limit)
+    const needle = prefix.toLowerCase()
+    const matches: string[] = []
+    for (const k of list) {
+      if (k.toLowerCase().includes(needle)) {
+        matches.push(k)
+        if (matches.length >= limit) break
+      }
+    }
+    return matches
   }
 
   return { subscribe, add, clear, filterByPrefix }
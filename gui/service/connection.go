@@ -1,6 +1,7 @@
 package service
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -20,6 +21,20 @@ type ConnectionService struct {
 	configDir string
 	connected bool
 	activeCtx *Context
+
+	// connectGen is bumped by every Connect and disconnect. A dial that
+	// started under an older generation has been superseded and must not
+	// install its client.
+	connectGen uint64
+	// newClient creates the memcached client for Connect, memcached.New
+	// when nil.
+	newClient func(addr string) (memcached.Client, error)
+
+	// contexts caches the parsed content of contexts.json, so that callers
+	// don't re-read and re-unmarshal the file on every access.
+	contexts []Context
+	raw      []byte
+	loaded   bool
 }
 
 // NewConnectionService creates a new ConnectionService.
@@ -48,20 +63,16 @@ func (s *ConnectionService) LoadContexts() ([]Context, error) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	path := s.configPath()
-	data, err := os.ReadFile(path)
+	contexts, err := s.loadContextsLocked()
 	if err != nil {
-		if os.IsNotExist(err) {
-			return []Context{}, nil
-		}
-		return nil, fmt.Errorf("failed to read config: %w", err)
+		return nil, err
 	}
 
-	var contexts []Context
-	if err := json.Unmarshal(data, &contexts); err != nil {
-		return nil, fmt.Errorf("failed to parse config: %w", err)
-	}
-	return contexts, nil
+	// Hand out a copy so callers can't mutate the cached slice. It is never
+	// nil, so the frontend always receives a JSON array.
+	out := make([]Context, len(contexts))
+	copy(out, contexts)
+	return out, nil
 }
 
 // SaveContext saves or updates a context.
@@ -69,6 +80,15 @@ func (s *ConnectionService) SaveContext(ctx Context) (Context, error) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
+	if len(ctx.Servers) == 0 {
+		return ctx, fmt.Errorf("no servers configured in context")
+	}
+	for _, server := range ctx.Servers {
+		if err := server.Validate(); err != nil {
+			return ctx, err
+		}
+	}
+
 	if ctx.ID == "" {
 		ctx.ID = uuid.New().String()
 	}
@@ -78,20 +98,24 @@ func (s *ConnectionService) SaveContext(ctx Context) (Context, error) {
 		return ctx, err
 	}
 
-	// Update existing or append new
+	// Update existing or append new, without touching the cached slice
+	// until the write succeeds.
+	updated := make([]Context, len(contexts), len(contexts)+1)
+	copy(updated, contexts)
+
 	found := false
-	for i, c := range contexts {
+	for i, c := range updated {
 		if c.ID == ctx.ID {
-			contexts[i] = ctx
+			updated[i] = ctx
 			found = true
 			break
 		}
 	}
 	if !found {
-		contexts = append(contexts, ctx)
+		updated = append(updated, ctx)
 	}
 
-	return ctx, s.saveContextsLocked(contexts)
+	return ctx, s.saveContextsLocked(updated)
 }
 
 // DeleteContext removes a context by ID.
@@ -115,61 +139,116 @@ func (s *ConnectionService) DeleteContext(id string) error {
 }
 
 // Connect establishes a connection to the memcached servers in the given context.
+//
+// The service lock is not held while dialing and verifying the servers, so
+// LoadContexts, IsConnected and friends stay responsive during a slow connect.
+// A Connect, Disconnect or DeleteContext of the target issued meanwhile
+// supersedes the dial: its client is then closed instead of installed.
 func (s *ConnectionService) Connect(ctxID string) error {
+	target, gen, reused, err := s.prepareConnect(ctxID)
+	if err != nil || reused {
+		return err
+	}
+
+	addr := target.Address()
+
+	newClient := s.newClient
+	if newClient == nil {
+		newClient = func(addr string) (memcached.Client, error) { return memcached.New(addr) }
+	}
+
+	client, err := newClient(addr)
+	if err != nil {
+		return fmt.Errorf("failed to create client: %w", err)
+	}
+
+	// Verify connection by requesting server version
+	verifyCtx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+	defer cancel()
+
+	if _, err := client.Version(verifyCtx); err != nil {
+		client.Close()
+		return fmt.Errorf("failed to connect to %s: %w", addr, err)
+	}
+
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	// Disconnect existing connection
-	if s.client != nil {
-		s.client.Close()
-		s.client = nil
-		s.connected = false
+	if gen != s.connectGen || !s.hasContextLocked(target.ID) {
+		client.Close()
+		return fmt.Errorf("connect to %s superseded by a later connect or disconnect", target.Name)
 	}
 
+	s.client = client
+	s.connected = true
+	s.activeCtx = target
+	return nil
+}
+
+// prepareConnect resolves ctxID to its context and drops the current
+// connection, unless it already points at the same servers, in which case
+// it is kept and reused is true. It starts a new connect generation, which
+// is returned for the caller to check before installing a client.
+func (s *ConnectionService) prepareConnect(ctxID string) (target *Context, gen uint64, reused bool, err error) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	s.connectGen++
+
 	contexts, err := s.loadContextsLocked()
 	if err != nil {
-		return err
+		return nil, 0, false, err
 	}
 
-	var target *Context
 	for i := range contexts {
 		if contexts[i].ID == ctxID {
-			target = &contexts[i]
+			found := contexts[i]
+			target = &found
 			break
 		}
 	}
-	if target == nil {
-		return fmt.Errorf("context not found: %s", ctxID)
-	}
 
-	if len(target.Servers) == 0 {
-		return fmt.Errorf("no servers configured in context")
+	// Already connected to the same servers: keep the client and its
+	// connection pool instead of dialing everything again.
+	if target != nil && s.client != nil && s.activeCtx != nil && sameServers(s.activeCtx.Servers, target.Servers) {
+		s.connected = true
+		s.activeCtx = target
+		return target, s.connectGen, true, nil
 	}
 
-	// Build comma-separated address string for cluster support
-	addr := target.Servers[0].Address()
-	for i := 1; i < len(target.Servers); i++ {
-		addr += "," + target.Servers[i].Address()
+	// Disconnect existing connection, a failed Connect leaves nothing active.
+	s.disconnectLocked()
+
+	if target == nil {
+		return nil, 0, false, fmt.Errorf("context not found: %s", ctxID)
 	}
 
-	client, err := memcached.New(addr)
-	if err != nil {
-		return fmt.Errorf("failed to create client: %w", err)
+	if len(target.Servers) == 0 {
+		return nil, 0, false, fmt.Errorf("no servers configured in context")
 	}
 
-	// Verify connection by requesting server version
-	verifyCtx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
-	defer cancel()
+	return target, s.connectGen, false, nil
+}
 
-	if _, err := client.Version(verifyCtx); err != nil {
-		client.Close()
-		return fmt.Errorf("failed to connect to %s: %w", addr, err)
+func (s *ConnectionService) hasContextLocked(id string) bool {
+	for _, c := range s.contexts {
+		if c.ID == id {
+			return true
+		}
 	}
+	return false
+}
 
-	s.client = client
-	s.connected = true
-	s.activeCtx = target
-	return nil
+func sameServers(a, b []MemcachedServer) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for i := range a {
+		if a[i].Address() != b[i].Address() {
+			return false
+		}
+	}
+	return true
 }
 
 // Disconnect closes the current memcached connection.
@@ -177,13 +256,18 @@ func (s *ConnectionService) Disconnect() error {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
+	s.disconnectLocked()
+	return nil
+}
+
+func (s *ConnectionService) disconnectLocked() {
+	s.connectGen++
 	if s.client != nil {
 		s.client.Close()
 		s.client = nil
 	}
 	s.connected = false
 	s.activeCtx = nil
-	return nil
 }
 
 // IsConnected returns whether there's an active connection.
@@ -204,26 +288,54 @@ func (s *ConnectionService) GetClient() (memcached.Client, error) {
 	return s.client, nil
 }
 
+// loadContextsLocked returns the cached contexts, reading and parsing the
+// config file only on first use. The returned slice must not be modified.
 func (s *ConnectionService) loadContextsLocked() ([]Context, error) {
+	if s.loaded {
+		return s.contexts, nil
+	}
+
 	path := s.configPath()
 	data, err := os.ReadFile(path)
 	if err != nil {
 		if os.IsNotExist(err) {
-			return []Context{}, nil
+			s.contexts, s.loaded = []Context{}, true
+			return s.contexts, nil
 		}
-		return nil, err
+		return nil, fmt.Errorf("failed to read config: %w", err)
 	}
 	var contexts []Context
 	if err := json.Unmarshal(data, &contexts); err != nil {
-		return nil, err
+		return nil, fmt.Errorf("failed to parse config: %w", err)
 	}
-	return contexts, nil
+
+	s.contexts, s.raw, s.loaded = contexts, data, true
+	return s.contexts, nil
 }
 
+// saveContextsLocked persists contexts and refreshes the cache. The write
+// is skipped when the encoded content is unchanged, and otherwise goes
+// through a temporary file so a crash never leaves a truncated config.
 func (s *ConnectionService) saveContextsLocked(contexts []Context) error {
 	data, err := json.MarshalIndent(contexts, "", "  ")
 	if err != nil {
 		return err
 	}
-	return os.WriteFile(s.configPath(), data, 0644)
+	if s.loaded && bytes.Equal(data, s.raw) {
+		s.contexts = contexts
+		return nil
+	}
+
+	path := s.configPath()
+	tmp := path + ".tmp"
+	if err := os.WriteFile(tmp, data, 0644); err != nil {
+		return err
+	}
+	if err := os.Rename(tmp, path); err != nil {
+		_ = os.Remove(tmp)
+		return err
+	}
+
+	s.contexts, s.raw, s.loaded = contexts, data, true
+	return nil
 }
@@ -0,0 +1,154 @@
+package service
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/require"
+	memcached "github.com/yeqown/memcached"
+)
+
+func TestConnectionServiceContextsRoundTrip(t *testing.T) {
+	dir := t.TempDir()
+	svc := &ConnectionService{configDir: dir}
+
+	saved, err := svc.SaveContext(Context{
+		Name:    "local",
+		Servers: []MemcachedServer{{Host: "localhost", Port: 11211}},
+	})
+	require.NoError(t, err)
+	require.NotEmpty(t, saved.ID)
+
+	saved.Name = "renamed"
+	_, err = svc.SaveContext(saved)
+	require.NoError(t, err)
+
+	contexts, err := svc.LoadContexts()
+	require.NoError(t, err)
+	require.Equal(t, []Context{saved}, contexts)
+
+	// Mutating the returned slice must not leak into the cache.
+	contexts[0].Name = "mutated"
+	contexts, err = svc.LoadContexts()
+	require.NoError(t, err)
+	require.Equal(t, "renamed", contexts[0].Name)
+
+	// A fresh service reads what was persisted to disk.
+	reloaded, err := (&ConnectionService{configDir: dir}).LoadContexts()
+	require.NoError(t, err)
+	require.Equal(t, []Context{saved}, reloaded)
+
+	// Writes go through a temporary file which must not be left behind.
+	_, err = os.Stat(filepath.Join(dir, "contexts.json.tmp"))
+	require.True(t, os.IsNotExist(err))
+
+	require.NoError(t, svc.DeleteContext(saved.ID))
+	contexts, err = svc.LoadContexts()
+	require.NoError(t, err)
+	require.NotNil(t, contexts)
+	require.Empty(t, contexts)
+}
+
+func TestConnectionServiceConnectReusesClientForSameServers(t *testing.T) {
+	svc := &ConnectionService{configDir: t.TempDir()}
+
+	saved, err := svc.SaveContext(Context{
+		Name:    "local",
+		Servers: []MemcachedServer{{Host: "localhost", Port: 11211}},
+	})
+	require.NoError(t, err)
+
+	fakeClient := &fakeMemcachedClient{}
+	svc.client = fakeClient
+	svc.activeCtx = &saved
+
+	require.NoError(t, svc.Connect(saved.ID))
+	require.Same(t, fakeClient, svc.client)
+	require.True(t, svc.IsConnected())
+}
+
+func TestConnectionServiceDisconnectDuringDialIsKept(t *testing.T) {
+	svc := &ConnectionService{configDir: t.TempDir()}
+
+	saved, err := svc.SaveContext(Context{
+		Name:    "slow",
+		Servers: []MemcachedServer{{Host: "localhost", Port: 11211}},
+	})
+	require.NoError(t, err)
+
+	dialing := make(chan struct{})
+	release := make(chan struct{})
+	fakeClient := &fakeMemcachedClient{}
+	svc.newClient = func(string) (memcached.Client, error) {
+		close(dialing)
+		<-release
+		return fakeClient, nil
+	}
+
+	done := make(chan error, 1)
+	go func() { done <- svc.Connect(saved.ID) }()
+
+	<-dialing
+	require.NoError(t, svc.Disconnect())
+	close(release)
+
+	require.ErrorContains(t, <-done, "superseded")
+	require.False(t, svc.IsConnected())
+	require.Nil(t, svc.client)
+	require.True(t, fakeClient.closed)
+}
+
+func TestConnectionServiceConnectUnknownContextDropsClient(t *testing.T) {
+	svc := &ConnectionService{configDir: t.TempDir()}
+
+	saved, err := svc.SaveContext(Context{
+		Name:    "local",
+		Servers: []MemcachedServer{{Host: "localhost", Port: 11211}},
+	})
+	require.NoError(t, err)
+
+	fakeClient := &fakeMemcachedClient{}
+	svc.client = fakeClient
+	svc.connected = true
+	svc.activeCtx = &saved
+
+	require.ErrorContains(t, svc.Connect("missing-id"), "context not found")
+	require.Nil(t, svc.client)
+	require.False(t, svc.IsConnected())
+	require.True(t, fakeClient.closed)
+}
+
+func TestConnectionServiceSkipsUnchangedWrite(t *testing.T) {
+	dir := t.TempDir()
+	svc := &ConnectionService{configDir: dir}
+
+	_, err := svc.SaveContext(Context{
+		Name:    "local",
+		Servers: []MemcachedServer{{Host: "localhost", Port: 11211}},
+	})
+	require.NoError(t, err)
+
+	// Removing the file exposes any rewrite: deleting an unknown ID leaves
+	// the contexts unchanged, so nothing may be written back.
+	path := filepath.Join(dir, "contexts.json")
+	require.NoError(t, os.Remove(path))
+
+	require.NoError(t, svc.DeleteContext("missing-id"))
+
+	_, err = os.Stat(path)
+	require.True(t, os.IsNotExist(err))
+	_, err = os.Stat(path + ".tmp")
+	require.True(t, os.IsNotExist(err))
+}
+
+func TestConnectionServiceSaveContextRejectsNoServers(t *testing.T) {
+	svc := &ConnectionService{configDir: t.TempDir()}
+
+	_, err := svc.SaveContext(Context{Name: "empty"})
+	require.ErrorContains(t, err, "no servers")
+
+	contexts, err := svc.LoadContexts()
+	require.NoError(t, err)
+	require.Empty(t, contexts)
+}
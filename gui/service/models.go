@@ -13,7 +13,25 @@ type MemcachedServer struct {
 
 // Address returns the host:port string for connecting.
 func (s MemcachedServer) Address() string {
-	return fmt.Sprintf("%s:%d", strings.TrimPrefix(strings.TrimSpace(s.Host), "/"), s.Port)
+	return fmt.Sprintf("%s:%d", s.host(), s.Port)
+}
+
+// host returns the host as used for connecting, without surrounding spaces
+// or a leading slash.
+func (s MemcachedServer) host() string {
+	return strings.TrimPrefix(strings.TrimSpace(s.Host), "/")
+}
+
+// Validate reports whether the server has a host and a usable TCP port.
+func (s MemcachedServer) Validate() error {
+	host := s.host()
+	if host == "" {
+		return fmt.Errorf("server host cannot be empty")
+	}
+	if s.Port <= 0 || s.Port > 65535 {
+		return fmt.Errorf("invalid port for %s: %d", host, s.Port)
+	}
+	return nil
 }
 
 // Context represents a group of memcached servers (a cluster).
@@ -23,6 +41,16 @@ type Context struct {
 	Servers []MemcachedServer `json:"servers"`
 }
 
+// Address returns the comma-separated addresses of all servers, the form
+// memcached.New expects for a cluster.
+func (c Context) Address() string {
+	addrs := make([]string, len(c.Servers))
+	for i, server := range c.Servers {
+		addrs[i] = server.Address()
+	}
+	return strings.Join(addrs, ",")
+}
+
 // OperationResult is the unified response for memcached operations.
 type OperationResult struct {
 	Success          bool   `json:"success"`
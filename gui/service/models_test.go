@@ -9,3 +9,36 @@ func TestMemcachedServerAddressStripsLeadingSlash(t *testing.T) {
 		t.Fatalf("Address() = %q, want %q", got, want)
 	}
 }
+
+func TestMemcachedServerValidate(t *testing.T) {
+	tests := []struct {
+		name    string
+		server  MemcachedServer
+		wantErr bool
+	}{
+		{name: "valid", server: MemcachedServer{Host: "localhost", Port: 11211}},
+		{name: "empty host", server: MemcachedServer{Host: "  ", Port: 11211}, wantErr: true},
+		{name: "slash only host", server: MemcachedServer{Host: " /", Port: 11211}, wantErr: true},
+		{name: "zero port", server: MemcachedServer{Host: "localhost", Port: 0}, wantErr: true},
+		{name: "port out of range", server: MemcachedServer{Host: "localhost", Port: 65536}, wantErr: true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if err := tt.server.Validate(); (err != nil) != tt.wantErr {
+				t.Fatalf("Validate() error = %v, wantErr %v", err, tt.wantErr)
+			}
+		})
+	}
+}
+
+func TestContextAddressJoinsServers(t *testing.T) {
+	c := Context{Servers: []MemcachedServer{
+		{Host: "10.0.0.1", Port: 11211},
+		{Host: " /10.0.0.2", Port: 11212},
+	}}
+
+	if got, want := c.Address(), "10.0.0.1:11211,10.0.0.2:11212"; got != want {
+		t.Fatalf("Address() = %q, want %q", got, want)
+	}
+}
@@ -29,9 +29,13 @@ type fakeMemcachedClient struct {
 	getCalled     bool
 	metaGetCalled bool
 	metaGetKey    string
+	closed        bool
 }
 
-func (f *fakeMemcachedClient) Close() error { return nil }
+func (f *fakeMemcachedClient) Close() error {
+	f.closed = true
+	return nil
+}
 
 func (f *fakeMemcachedClient) Set(context.Context, string, []byte, uint32, time.Duration) error {
 	return nil